@@ -0,0 +1,124 @@
+import numpy as np
+from numba import njit, prange
+
+INSIDE = 0
+LEFT = 1
+RIGHT = 2
+BOTTOM = 4
+TOP = 8
+
+
+# Explicit signatures compile the kernels eagerly at import, so no warm-up call is needed. The batch runs in float32,
+# where pixel coordinates fit comfortably; the float64 overloads keep the scalar wrappers from rounding Python floats
+@njit(["int32(float32, float32, float32, float32, float32, float32)",
+       "int32(float64, float64, float64, float64, float64, float64)"], fastmath=True, cache=True)
+def region_code(x, y, x_min, x_max, y_min, y_max):
+    """
+        Determines the region code for a given point with respect to a rectangle.
+
+        Args:
+            x, y: Coordinates of the point.
+            x_min, x_max, y_min, y_max: Coordinates of the rectangle defining the clipping area.
+
+        Returns:
+            int: Region code based on the position of the point relative to the rectangle.
+        """
+    # Branchless: each comparison lands on its own bit (LEFT=1, RIGHT=2, BOTTOM=4, TOP=8)
+    return np.int32((x < x_min) | ((x > x_max) << 1) | ((y < y_min) << 2) | ((y > y_max) << 3))
+
+
+@njit(["Tuple((boolean, float32, float32, float32, float32))"
+       "(float32, float32, float32, float32, float32, float32, float32, float32)",
+       "Tuple((boolean, float64, float64, float64, float64))"
+       "(float64, float64, float64, float64, float64, float64, float64, float64)"], fastmath=True, cache=True)
+def _cs_clip_core(x_initial, y_initial, x_final, y_final, x_min, y_min, x_max, y_max):
+    """
+        Numeric core of the Cohen-Sutherland line clipping algorithm.
+
+        Args:
+            x_initial, y_initial: Coordinates of the initial point of the line.
+            x_final, y_final: Coordinates of the final point of the line.
+            x_min, y_min: Minimum coordinates of the clipping window.
+            x_max, y_max: Maximum coordinates of the clipping window.
+
+        Returns:
+            Tuple: (accept, x_initial, y_initial, x_final, y_final) with the clipped line segment.
+        """
+    code1 = region_code(x_initial, y_initial, x_min, x_max, y_min, y_max)
+    code2 = region_code(x_final, y_final, x_min, x_max, y_min, y_max)
+
+    accept = False
+    clips = 0
+
+    while True:
+        # If both endpoints lie within rectangle
+        if code1 == 0 and code2 == 0:
+            accept = True
+            break
+        # If both endpoints are outside rectangle, in the same region
+        elif code1 & code2:
+            break
+        # Cohen-Sutherland never needs more than four edge clips; the cap stops float rounding from cycling forever
+        elif clips == 4:
+            break
+        else:  # Some segment of line lies within the rectangle
+            x, y = x_initial, y_initial
+            clips += 1
+
+            if code1 != 0:
+                code_out = code1
+            else:
+                code_out = code2
+            code = code_out
+
+            # The new point lies exactly on the clipped edge, so only the bits of the other axis need updating
+            if (code_out & TOP) != 0:
+                x = x_initial + (x_final - x_initial) * (y_max - y_initial) / (y_final - y_initial)
+                y = y_max
+                code = np.int32((x < x_min) | ((x > x_max) << 1))
+            elif (code_out & BOTTOM) != 0:
+                x = x_initial + (x_final - x_initial) * (y_min - y_initial) / (y_final - y_initial)
+                y = y_min
+                code = np.int32((x < x_min) | ((x > x_max) << 1))
+            elif (code_out & RIGHT) != 0:
+                y = y_initial + (y_final - y_initial) * (x_max - x_initial) / (x_final - x_initial)
+                x = x_max
+                code = np.int32(((y < y_min) << 2) | ((y > y_max) << 3))
+            elif (code_out & LEFT) != 0:
+                y = y_initial + (y_final - y_initial) * (x_min - x_initial) / (x_final - x_initial)
+                x = x_min
+                code = np.int32(((y < y_min) << 2) | ((y > y_max) << 3))
+
+            # Now intersection point x, y is found
+            # Replace point outside rectangle with intersection point
+            if code_out == code1:
+                x_initial = x
+                y_initial = y
+                code1 = code
+            else:
+                x_final = x
+                y_final = y
+                code2 = code
+
+    return accept, x_initial, y_initial, x_final, y_final
+
+
+@njit("void(float32[:], float32[:], float32[:], float32[:], float32, float32, float32, float32, "
+      "boolean[:], float32[:], float32[:], float32[:], float32[:])", parallel=True, fastmath=True, cache=True)
+def _cs_clip_batch(x1, y1, x2, y2, x_min, y_min, x_max, y_max, out_accept, out_x1, out_y1, out_x2, out_y2):
+    """
+        Clips a batch of lines with the Cohen-Sutherland algorithm, one line per parallel iteration.
+
+        Args:
+            x1, y1, x2, y2: Arrays (shape (N,)) with the endpoints of the lines.
+            x_min, y_min: Minimum coordinates of the clipping window.
+            x_max, y_max: Maximum coordinates of the clipping window.
+            out_accept, out_x1, out_y1, out_x2, out_y2: Preallocated arrays (shape (N,)) receiving the results.
+
+        Returns:
+            None
+        """
+    for i in prange(x1.shape[0]):
+        out_accept[i], out_x1[i], out_y1[i], out_x2[i], out_y2[i] = _cs_clip_core(x1[i], y1[i], x2[i], y2[i],
+                                                                                  x_min, y_min, x_max, y_max)
+
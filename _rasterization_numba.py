@@ -0,0 +1,203 @@
+import numpy as np
+from numba import njit, prange
+
+
+# Explicit signatures compile the kernels eagerly at import, so no warm-up call is needed. fastmath is left off: the
+# DDA accumulation must happen in the same order in the scalar and the batch kernels to land on the same pixels
+@njit("void(float64, float64, float64, float64, int64[:, :])", boundscheck=False, cache=True)
+def _dda_line_fill(x1, y1, x2, y2, out):
+    """
+        Writes the pixels of a line, computed with the Digital Differential Analyzer (DDA) algorithm, into a
+        preallocated array.
+
+        Args:
+            x1, y1: Coordinates of the starting point.
+            x2, y2: Coordinates of the ending point.
+            out: Array of shape (round(max(|dx|, |dy|)) + 1, 2) receiving one (x, y) pixel per row.
+
+        Returns:
+            None
+        """
+    dx = x2 - x1
+    dy = y2 - y1
+
+    steps = max(abs(dx), abs(dy))
+
+    # A zero-length line is just its starting pixel
+    inv = 1.0 / steps if steps else 0.0
+    x_incr = dx * inv
+    y_incr = dy * inv
+    x = x1
+    y = y1
+
+    out[0, 0] = round(x)
+    out[0, 1] = round(y)
+    for k in range(1, out.shape[0]):
+        x += x_incr
+        y += y_incr
+        out[k, 0] = round(x)
+        out[k, 1] = round(y)
+
+
+@njit("int64[:, :](float64, float64, float64, float64)", cache=True)
+def _dda_line_kernel(x1, y1, x2, y2):
+    """
+        Computes the pixels of a line with the Digital Differential Analyzer (DDA) algorithm.
+
+        Args:
+            x1, y1: Coordinates of the starting point.
+            x2, y2: Coordinates of the ending point.
+
+        Returns:
+            np.ndarray: Array of shape (N, 2) with one (x, y) pixel per row.
+        """
+    out = np.empty((round(max(abs(x2 - x1), abs(y2 - y1))) + 1, 2), dtype=np.int64)
+    _dda_line_fill(x1, y1, x2, y2, out)
+    return out
+
+
+@njit("void(float64[:], float64[:], float64[:], float64[:], int64[:], int64[:, :])", parallel=True,
+      boundscheck=False, cache=True)
+def _dda_batch_kernel(x1, y1, x2, y2, starts, out):
+    """
+        Rasterizes a batch of lines with the DDA algorithm, one line per parallel iteration.
+
+        Args:
+            x1, y1, x2, y2: Arrays (shape (N,)) with the endpoints of the lines.
+            starts: Array (shape (N + 1,)) with the row of out where each line's pixels begin, plus the total.
+            out: Preallocated array (shape (starts[N], 2)) receiving the pixels of all lines one after the other.
+
+        Returns:
+            None
+        """
+    for i in prange(x1.shape[0]):
+        _dda_line_fill(x1[i], y1[i], x2[i], y2[i], out[starts[i]:starts[i + 1]])
+
+
+@njit("void(int64, int64, int64, int64, int64[:, :])", boundscheck=False, cache=True)
+def _bresenham_line_fill(x_initial, y_initial, x_final, y_final, out):
+    """
+        Writes the pixels of a line, computed with Bresenham's line drawing algorithm, into a preallocated array.
+
+        Args:
+            x_initial, y_initial: Coordinates of the starting point.
+            x_final, y_final: Coordinates of the ending point.
+            out: Array of shape (max(|dx|, |dy|) + 1, 2) receiving one (x, y) pixel per row.
+
+        Returns:
+            None
+        """
+    dx = abs(x_final - x_initial)  # Delta x
+    dy = abs(y_final - y_initial)  # Delta y
+
+    if x_initial < x_final:
+        incrx = 1
+    else:
+        incrx = -1
+
+    if y_initial < y_final:
+        incry = 1
+    else:
+        incry = -1
+
+    x = x_initial
+    y = y_initial
+
+    out[0, 0] = x
+    out[0, 1] = y
+
+    if dx > dy:
+        decision_p = 2 * dy - dx
+        incE = 2 * dy
+        incNE = 2 * (dy - dx)
+
+        for i in range(1, dx + 1):
+            # Branchless step: m selects the NE move, which also advances y
+            m = np.int64(decision_p > 0)
+            decision_p += incE + m * (incNE - incE)
+            x += incrx
+            y += m * incry
+            out[i, 0] = x
+            out[i, 1] = y
+    else:
+        decision_p = 2 * dx - dy
+        incN = 2 * dx
+        incNE = 2 * (dx - dy)
+
+        for i in range(1, dy + 1):
+            m = np.int64(decision_p > 0)
+            decision_p += incN + m * (incNE - incN)
+            x += m * incrx
+            y += incry
+            out[i, 0] = x
+            out[i, 1] = y
+
+
+@njit("int64[:, :](int64, int64, int64, int64)", boundscheck=False, cache=True)
+def _bresenham_line_kernel(x_initial, y_initial, x_final, y_final):
+    """
+        Computes the pixels of a line with Bresenham's line drawing algorithm.
+
+        Args:
+            x_initial, y_initial: Coordinates of the starting point.
+            x_final, y_final: Coordinates of the ending point.
+
+        Returns:
+            np.ndarray: Array of shape (N, 2) with one (x, y) pixel per row.
+        """
+    out = np.empty((max(abs(x_final - x_initial), abs(y_final - y_initial)) + 1, 2), dtype=np.int64)
+    _bresenham_line_fill(x_initial, y_initial, x_final, y_final, out)
+    return out
+
+
+@njit("void(int64[:], int64[:], int64[:], int64[:], int64[:], int64[:, :])", parallel=True, boundscheck=False,
+      cache=True)
+def _bresenham_batch_kernel(x1, y1, x2, y2, starts, out):
+    """
+        Rasterizes a batch of lines with Bresenham's algorithm, one line per parallel iteration.
+
+        Args:
+            x1, y1, x2, y2: Arrays (shape (N,)) with the endpoints of the lines.
+            starts: Array (shape (N + 1,)) with the row of out where each line's pixels begin, plus the total.
+            out: Preallocated array (shape (starts[N], 2)) receiving the pixels of all lines one after the other.
+
+        Returns:
+            None
+        """
+    for i in prange(x1.shape[0]):
+        _bresenham_line_fill(x1[i], y1[i], x2[i], y2[i], out[starts[i]:starts[i + 1]])
+
+
+@njit("float64[:, :](float64)", cache=True)
+def _bresenham_circle_octant_kernel(r):
+    """
+        Computes the pixels of one octant of a circle centered at the origin with Bresenham's circle drawing algorithm.
+
+        Args:
+            r: Radius of the circle.
+
+        Returns:
+            np.ndarray: Array of shape (N, 2) with the (x, y) pixels from (0, r) until x reaches y.
+        """
+    x = 0.0
+    y = r
+    p = 3 - 2 * r
+
+    # The loop stops once x passes |r| / sqrt(2); a negative radius stops after its first pixel
+    out = np.empty((int(abs(r) / np.sqrt(2.0)) + 3, 2))
+    count = 0
+    while True:
+        out[count, 0] = x
+        out[count, 1] = y
+        count += 1
+
+        if x >= y:
+            break
+        if p < 0:
+            p = p + 4 * x + 6
+        else:
+            p = p + 4 * (x - y) + 10
+            y -= 1
+        x += 1
+
+    return out[:count]
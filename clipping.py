@@ -1,10 +1,13 @@
-INSIDE = 0
-LEFT = 1
-RIGHT = 2
-BOTTOM = 4
-TOP = 8
+import logging
 
-def clipping_cohen_sutherland(x_initial, y_initial, x_final, y_final, c_initial, c_final, cartesian_plane):
+import numpy as np
+
+from _clipping_numba import region_code, _cs_clip_core, _cs_clip_batch
+
+logger = logging.getLogger(__name__)
+
+
+def clipping_cohen_sutherland(x_initial, y_initial, x_final, y_final, c_initial, c_final):
     """
         Implements the Cohen-Sutherland line clipping algorithm.
 
@@ -12,106 +15,55 @@ def clipping_cohen_sutherland(x_initial, y_initial, x_final, y_final, c_initial,
             x_initial, y_initial: Coordinates of the initial point of the line.
             x_final, y_final: Coordinates of the final point of the line.
             c_initial, c_final: Coordinates of the clipping window (rectangle).
-            cartesian_plane: Tkinter canvas object to draw the clipped line.
 
         Returns:
             Tuple: (accept, clipped_line), where accept is a boolean indicating if the line was accepted after clipping,
             and clipped_line is a tuple containing the coordinates of the clipped line segment.
         """
-
-    width = cartesian_plane.winfo_width()
-    height = cartesian_plane.winfo_height()
-
     x_min, y_min = c_initial
     x_max, y_max = c_final
 
-    code1 = region_code(x_initial, y_initial, x_min, x_max, y_min, y_max)
-    code2 = region_code(x_final, y_final, x_min, x_max, y_min, y_max)
-
-    accept = False
-    line_accepted = False  # Verifica se pelo menos parte da linha está dentro da área de recorte
-
-    while True:
-        # If both endpoints lie within rectangle or both are outside rectangle in the same region
-        if (code1 == 0 and code2 == 0) or (code1 & code2 != 0):
-            accept = True
-            break
-        # If both endpoints are outside rectangle, in the same region
-        elif (code1 & code2) != 0:
-            break
-        else:  # Some segment of line lies within the rectangle
-            code_out = 0
-            x, y = 0, 0
-
-            if code1 != 0:
-                code_out = code1
-            else:
-                code_out = code2
-
-            if (code_out & TOP) != 0:
-                x = x_initial + (x_final - x_initial) * (y_max - y_initial) / (y_final - y_initial)
-                y = y_max
-            elif (code_out & BOTTOM) != 0:
-                x = x_initial + (x_final - x_initial) * (y_min - y_initial) / (y_final - y_initial)
-                y = y_min
-            elif (code_out & RIGHT) != 0:
-                y = y_initial + (y_final - y_initial) * (x_max - x_initial) / (x_final - x_initial)
-                x = x_max
-            elif (code_out & LEFT) != 0:
-                y = y_initial + (y_final - y_initial) * (x_min - x_initial) / (x_final - x_initial)
-                x = x_min
-
-            # Now intersection point x, y is found
-            # Replace point outside rectangle with intersection point
-            if code_out == code1:
-                x_initial = x
-                y_initial = y
-                code1 = region_code(x_initial, y_initial, x_min, x_max, y_min, y_max)
-            else:
-                x_final = x
-                y_final = y
-                code2 = region_code(x_final, y_final, x_min, x_max, y_min, y_max)
-
-            # Verifica se pelo menos parte da linha está dentro da área de recorte
-            if (x_min <= x_initial <= x_max and y_min <= y_initial <= y_max) or (x_min <= x_final <= x_max and y_min <= y_final <= y_max):
-                line_accepted = True
-
-    if accept and line_accepted:  # Aceita a linha somente se pelo menos parte dela estiver dentro da área de recorte
-        print("Line accepted from " + str(x_initial) + ", " + str(y_initial) + " to " + str(x_final) + ", " + str(
-            y_final))
-        cartesian_plane.create_line(x_initial, y_initial, x_final, y_final, fill="red")
+    accept, x_initial, y_initial, x_final, y_final = _cs_clip_core(x_initial, y_initial, x_final, y_final,
+                                                                   x_min, y_min, x_max, y_max)
+
+    if accept:
+        logger.debug("Line accepted from %s, %s to %s, %s", x_initial, y_initial, x_final, y_final)
         return True, ((x_initial, y_initial), (x_final, y_final))
     else:
-        print("Line rejected")
+        logger.debug("Line rejected")
         return False, (None, None)
 
-def region_code(x, y, x_min, x_max, y_min, y_max):
+
+def clip_cohen_sutherland_batch(x1, y1, x2, y2, xmin, ymin, xmax, ymax):
     """
-        Determines the region code for a given point with respect to a rectangle.
+        Implements the Cohen-Sutherland line clipping algorithm for a batch of lines at once.
 
         Args:
-            x, y: Coordinates of the point.
-            x_min, x_max, y_min, y_max: Coordinates of the rectangle defining the clipping area.
+            x1, y1: Arrays (shape (N,)) with the coordinates of the initial points of the lines.
+            x2, y2: Arrays (shape (N,)) with the coordinates of the final points of the lines.
+            xmin, ymin: Minimum coordinates of the clipping window.
+            xmax, ymax: Maximum coordinates of the clipping window.
 
         Returns:
-            int: Region code based on the position of the point relative to the rectangle.
+            Tuple: (accept, x1, y1, x2, y2), where accept is a boolean mask of the lines accepted after clipping
+            and the remaining arrays hold the clipped endpoints (only meaningful where accept is True).
         """
-    code = INSIDE
-
-    if x < x_min:  # to the left of rectangle
-        code |= LEFT
-    elif x > x_max:  # to the right of rectangle
-        code |= RIGHT
-    if y < y_min:  # below the rectangle
-        code |= BOTTOM
-    elif y > y_max:  # above the rectangle
-        code |= TOP
+    n = len(x1)
+    accept = np.empty(n, dtype=np.bool_)
+    out_x1 = np.empty(n, dtype=np.float32)
+    out_y1 = np.empty(n, dtype=np.float32)
+    out_x2 = np.empty(n, dtype=np.float32)
+    out_y2 = np.empty(n, dtype=np.float32)
 
-    return code
+    _cs_clip_batch(np.asarray(x1, dtype=np.float32), np.asarray(y1, dtype=np.float32),
+                   np.asarray(x2, dtype=np.float32), np.asarray(y2, dtype=np.float32),
+                   xmin, ymin, xmax, ymax,
+                   accept, out_x1, out_y1, out_x2, out_y2)
 
+    return accept, out_x1, out_y1, out_x2, out_y2
 
 
-def clipping_liang_barsky(x1, y1, x2, y2, xmin, ymin, xmax, ymax, cartesian_object):
+def clipping_liang_barsky(x1, y1, x2, y2, xmin, ymin, xmax, ymax):
     """
         Implements the Liang-Barsky line clipping algorithm.
 
@@ -120,65 +72,158 @@ def clipping_liang_barsky(x1, y1, x2, y2, xmin, ymin, xmax, ymax, cartesian_obje
             x2, y2: Coordinates of the final point of the line.
             xmin, ymin: Minimum coordinates of the clipping window.
             xmax, ymax: Maximum coordinates of the clipping window.
-            cartesian_object: Tkinter canvas object to draw the clipped line.
 
         Returns:
             Tuple: (accept, clipped_line), where accept is a boolean indicating if the line was accepted after clipping,
             and clipped_line is a tuple containing the coordinates of the clipped line segment.
         """
-    # defining variables
-    p1 = -(x2 - x1)
-    p2 = -p1
-    p3 = -(y2 - y1)
-    p4 = -p3
-
-    q1 = x1 - xmin
-    q2 = xmax - x1
-    q3 = y1 - ymin
-    q4 = ymax - y1
-
-    posarr = [1]
-    negarr = [0]
-    posind = 1
-    negind = 1
-
-    if ((p1 == 0 and q1 < 0) or (p2 == 0 and q2 < 0) or (p3 == 0 and q3 < 0) or (p4 == 0 and q4 < 0)):
-        print("Line is parallel to clipping window!")
+    code1 = region_code(x1, y1, xmin, xmax, ymin, ymax)
+    code2 = region_code(x2, y2, xmin, xmax, ymin, ymax)
+
+    if code1 == 0 and code2 == 0:  # both endpoints inside: nothing to clip
+        return True, ((x1, y1), (x2, y2))
+    if code1 & code2:  # both endpoints outside the same edge
+        logger.debug("Line is outside the clipping window!")
         return False, (None, None)
 
-    if p1 != 0:
-        r1 = q1 / p1
-        r2 = q2 / p2
-        if p1 < 0:
-            negarr.append(r1)  # for negative p1, add it to negative array
-            posarr.append(r2)  # and add p2 to positive array
-        else:
-            negarr.append(r2)
-            posarr.append(r1)
-
-    if p3 != 0:
-        r3 = q3 / p3
-        r4 = q4 / p4
-        if p3 < 0:
-            negarr.append(r3)
-            posarr.append(r4)
+    dx = x2 - x1
+    dy = y2 - y1
+
+    t_enter = 0.0
+    t_exit = 1.0
+
+    # One (p, q) pair per window edge: left, right, bottom, top
+    for p, q in ((-dx, x1 - xmin), (dx, xmax - x1), (-dy, y1 - ymin), (dy, ymax - y1)):
+        if p == 0:
+            if q < 0:
+                logger.debug("Line is parallel to clipping window!")
+                return False, (None, None)
+        elif p < 0:
+            r = q / p
+            if r > t_enter:
+                t_enter = r
         else:
-            negarr.append(r4)
-            posarr.append(r3)
+            r = q / p
+            if r < t_exit:
+                t_exit = r
 
-    rn1 = max(negarr)  # maximum of negative array
-    rn2 = min(posarr)  # minimum of positive array
+        if t_enter > t_exit:  # reject
+            logger.debug("Line is outside the clipping window!")
+            return False, (None, None)
 
-    if rn1 > rn2:  # reject
-        print("Line is outside the clipping window!")
-        return False, (None, None)
+    xn1 = x1 + dx * t_enter
+    yn1 = y1 + dy * t_enter  # computing new points
+
+    xn2 = x1 + dx * t_exit
+    yn2 = y1 + dy * t_exit
+
+    return True, ((xn1, yn1), (xn2, yn2))
+
+
+def clip_liang_barsky_batch(x1, y1, x2, y2, xmin, ymin, xmax, ymax):
+    """
+        Implements the Liang-Barsky line clipping algorithm for a batch of lines at once.
+
+        Args:
+            x1, y1: Arrays (shape (N,)) with the coordinates of the initial points of the lines.
+            x2, y2: Arrays (shape (N,)) with the coordinates of the final points of the lines.
+            xmin, ymin: Minimum coordinates of the clipping window.
+            xmax, ymax: Maximum coordinates of the clipping window.
+
+        Returns:
+            Tuple: (accept, x1, y1, x2, y2), where accept is a boolean mask of the lines accepted after clipping
+            and the remaining arrays hold the clipped endpoints (only meaningful where accept is True).
+        """
+    x1 = np.asarray(x1, dtype=np.float32)
+    y1 = np.asarray(y1, dtype=np.float32)
+    x2 = np.asarray(x2, dtype=np.float32)
+    y2 = np.asarray(y2, dtype=np.float32)
+
+    dx = x2 - x1
+    dy = y2 - y1
+
+    # One (p, q) pair per window edge: left, right, bottom, top
+    p = np.stack((-dx, dx, -dy, dy))
+    q = np.stack((x1 - xmin, xmax - x1, y1 - ymin, ymax - y1))
+
+    # Lines parallel to an edge and outside of it
+    parallel_reject = np.logical_or.reduce((p == 0) & (q < 0), axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = q / p
+
+    t_enter = np.maximum.reduce(np.where(p < 0, r, 0), axis=0)
+    t_exit = np.minimum.reduce(np.where(p > 0, r, 1), axis=0)
+
+    accept = (t_enter <= t_exit) & ~parallel_reject
 
-    xn1 = x1 + p2 * rn1
-    yn1 = y1 + p4 * rn1  # computing new points
+    return accept, x1 + dx * t_enter, y1 + dy * t_enter, x1 + dx * t_exit, y1 + dy * t_exit
 
-    xn2 = x1 + p2 * rn2
-    yn2 = y1 + p4 * rn2
 
-    cartesian_object.create_line(xn1, yn1, xn2, yn2, fill="red")
+# Skala's coding scheme: bit k of the code is set when window vertex k lies on the non-negative side of the line,
+# with vertices ordered (xmin, ymin), (xmax, ymin), (xmax, ymax), (xmin, ymax). Edge k joins vertex k to vertex k + 1
+# (0: y = ymin, 1: x = xmax, 2: y = ymax, 3: x = xmin) and each row names the two edges the line crosses.
+# Codes 0 and 15 miss the window; 5 and 10 cannot happen for a straight line.
+_SKALA_EDGES = np.array([
+    [-1, -1], [0, 3], [0, 1], [1, 3],
+    [1, 2], [-1, -1], [0, 2], [2, 3],
+    [2, 3], [0, 2], [-1, -1], [1, 2],
+    [1, 3], [0, 1], [0, 3], [-1, -1],
+], dtype=np.int8)
 
-    return True, ((xn1, yn1), (xn2, yn2))
\ No newline at end of file
+
+def clip_skala_batch(x1, y1, x2, y2, xmin, ymin, xmax, ymax):
+    """
+        Implements Skala's coding-scheme line clipping algorithm for a batch of lines at once.
+
+        Instead of locating the line endpoints relative to the window, the four window vertices are located relative
+        to each line, and the resulting 4-bit code selects the two crossed edges from a lookup table. There is no
+        iteration and at most two divisions per line.
+
+        Args:
+            x1, y1: Arrays (shape (N,)) with the coordinates of the initial points of the lines.
+            x2, y2: Arrays (shape (N,)) with the coordinates of the final points of the lines.
+            xmin, ymin: Minimum coordinates of the clipping window.
+            xmax, ymax: Maximum coordinates of the clipping window.
+
+        Returns:
+            Tuple: (accept, x1, y1, x2, y2), where accept is a boolean mask of the lines accepted after clipping
+            and the remaining arrays hold the clipped endpoints (only meaningful where accept is True).
+        """
+    x1 = np.asarray(x1, dtype=np.float32)
+    y1 = np.asarray(y1, dtype=np.float32)
+    x2 = np.asarray(x2, dtype=np.float32)
+    y2 = np.asarray(y2, dtype=np.float32)
+
+    dx = x2 - x1
+    dy = y2 - y1
+
+    # Side of the line each window vertex lies on. A vertex exactly on the line counts as the non-negative side;
+    # when that makes the line look like it misses the window (it only touches or runs along an edge), the strict
+    # side test gives the crossing instead.
+    code = np.zeros(x1.shape, dtype=np.int8)
+    strict_code = np.zeros(x1.shape, dtype=np.int8)
+    for bit, (vx, vy) in enumerate(((xmin, ymin), (xmax, ymin), (xmax, ymax), (xmin, ymax))):
+        side = dy * (vx - x1) - dx * (vy - y1)
+        code |= (side >= 0).astype(np.int8) << bit
+        strict_code |= (side > 0).astype(np.int8) << bit
+    code = np.where((code == 0) | (code == 15), strict_code, code)
+
+    edges = _SKALA_EDGES[code]
+
+    # Line parameter t where the line meets each of the two edges; even edges are horizontal, odd ones vertical
+    bounds = np.array([ymin, xmax, ymax, xmin], dtype=np.float32)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = [np.where(e % 2 == 0, (bounds[e] - y1) / dy, (bounds[e] - x1) / dx) for e in (edges[:, 0], edges[:, 1])]
+
+    t_enter = np.maximum(np.minimum(t[0], t[1]), 0)
+    t_exit = np.minimum(np.maximum(t[0], t[1]), 1)
+    accept = (edges[:, 0] >= 0) & (t_enter <= t_exit)
+
+    # Zero-length lines have no side to test against; keep them when they lie inside the window
+    point = (dx == 0) & (dy == 0)
+    accept |= point & (x1 >= xmin) & (x1 <= xmax) & (y1 >= ymin) & (y1 <= ymax)
+    t_enter[~accept | point] = 0
+    t_exit[~accept | point] = 0
+
+    return accept, x1 + dx * t_enter, y1 + dy * t_enter, x1 + dx * t_exit, y1 + dy * t_exit
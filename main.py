@@ -3,10 +3,15 @@ from tkinter import simpledialog
 
 import clipping
 import rasterization
+import scene
 import transformation2d
 
+import contextlib
+import functools
 import math
 
+import numpy as np
+
 
 def euclidean_distance(x1, y1, x2, y2):
     """
@@ -27,6 +32,12 @@ def euclidean_distance(x1, y1, x2, y2):
     return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
 
 
+@functools.lru_cache(maxsize=None)
+def color_hex(color):
+    """Converts an RGB color tuple to the '#rrggbb' string expected by Tk."""
+    return '#{0:02x}{1:02x}{2:02x}'.format(color[0], color[1], color[2])
+
+
 class CartesianPlane(tk.Canvas):
     """
     Custom canvas widget representing a Cartesian plane for graphical operations.
@@ -42,25 +53,40 @@ class CartesianPlane(tk.Canvas):
         drawing_circle_bresenham (bool): Flag indicating whether Bresenham circle drawing mode is active.
         drawing_cohen_clipping (bool): Flag indicating whether Cohen-Sutherland clipping mode is active.
         drawing_liang_clipping (bool): Flag indicating whether Liang-Barsky clipping mode is active.
+        drawing_skala_clipping (bool): Flag indicating whether Skala clipping mode is active.
         edges (tuple): The coordinates of the clipping rectangle edges.
-        lines (list): List containing tuples representing lines [(x1, y1), (x2, y2)].
-        circles (list): List containing tuples representing circles [(center_x, center_y), radius].
+        lines (scene.LineBuffer): The stored lines, one (x1, y1, x2, y2) row each.
+        circles (scene.CircleBuffer): The stored circles, one (center_x, center_y, radius) row each.
+        scene_tag (str): Canvas tag shared by every pixel of the stored lines and circles.
+        M_cart_to_pix (np.ndarray): 3x3 homogeneous matrix converting Cartesian plane coordinates to canvas pixels.
+        M_pix_to_cart (np.ndarray): 3x3 homogeneous matrix converting canvas pixels to Cartesian plane coordinates.
 
     Methods:
         _on_resize(event): Event handler for canvas resize.
+        _set_origin(x, y): Moves the origin of the plane and updates the coordinate conversion matrices.
+        delete_overlays(): Deletes the click marks and the clipping window.
         draw_axes(): Draws the x and y axes on the canvas.
         cartesian_plan_coordinates(x, y): Converts canvas coordinates to Cartesian plane coordinates.
         get_pixel_coordinates(x, y): Converts Cartesian plane coordinates to canvas pixel coordinates.
         _on_mouse_move(event): Event handler for mouse movement.
         _on_click(event): Event handler for mouse clicks.
+        _clip_lines(clip_batch, x_final, y_final): Clips all lines against the clipping window.
         translate_points(delta_x, delta_y): Translates all points by specified deltas.
         rotate_lines(angle): Rotates all lines by the specified angle.
         scale(factor): Scales all lines and circles by the specified factor.
         reflect(axis): Reflects all lines and circles across the specified axis.
-        draw_pixel(x, y, color): Draws a pixel on the canvas at the specified coordinates with the given color.
+        redraw_scene(): Clears the canvas and draws all stored lines and circles again.
+        line_tag(i): Returns the canvas tag of the i-th stored line.
+        draw_lines(indices, color): Rasterizes the given stored lines in one batch, each under its own tag.
+        _draw_dda_lines(indices, lines, color): Rasterizes lines with fractional endpoints using the batched DDA.
+        draw_pixel(x, y, color, tags): Draws a pixel on the canvas at the specified coordinates with the given color.
+        draw_pixels(points, color, tags): Draws many pixels, given as a sequence or an (N, 2) array, with a single Tcl call.
+        batch(): Context manager that groups the draw_pixels calls inside it into a single Tcl call.
         on_click_list(): Prints the list of lines to the console.
         toggle_cohen_clipping(): Activates Cohen-Sutherland clipping mode.
     """
+    scene_tag = "scene"
+
     def __init__(self, master, **kwargs):
         super().__init__(master, **kwargs)
         self.config(bg="white", highlightthickness=0)
@@ -68,23 +94,41 @@ class CartesianPlane(tk.Canvas):
         self.bind("<Motion>", self._on_mouse_move)
         self.bind("<Button-1>", self._on_click)
 
-        self.origin = None
+        # Initial origin from the requested size; _on_resize keeps it up to date afterwards
+        self.update_idletasks()
+        self._set_origin(self.winfo_reqwidth() / 2, self.winfo_reqheight() / 2)
+
         self.drawing_line_dda = False
         self.drawing_line_bresenham = False
         self.drawing_circle_bresenham = False
         self.drawing_cohen_clipping = False
         self.drawing_liang_clipping = False
+        self.drawing_skala_clipping = False
         self.edges = None
 
-        self.lines = []
-        self.circles = []
+        self.lines = scene.LineBuffer()
+        self.circles = scene.CircleBuffer()
+
+        # Tcl commands queued by draw_pixels while a batch() block is open
+        self._pending = None
 
     def _on_resize(self, event):
         """Handles canvas resize event."""
         self.update()
-        self.origin = (self.winfo_width() / 2, self.winfo_height() / 2)
+        self._set_origin(self.winfo_width() / 2, self.winfo_height() / 2)
         self.draw_axes()
 
+    def _set_origin(self, x, y):
+        """Moves the origin of the plane to canvas pixel (x, y) and rebuilds the coordinate conversion matrices."""
+        self.origin = (x, y)
+        self._ox, self._oy = self.origin
+        self.M_cart_to_pix = np.array([[1, 0, x], [0, -1, y], [0, 0, 1]], dtype=np.float64)
+        self.M_pix_to_cart = np.array([[1, 0, -x], [0, -1, y], [0, 0, 1]], dtype=np.float64)
+
+    def delete_overlays(self):
+        """Deletes everything but the stored scene and the axes, i.e. the click marks and the clipping window."""
+        self.delete(f"!{self.scene_tag}&&!axes")
+
     def draw_axes(self):
         """Draws the x and y axes on the canvas."""
         self.delete("axes")
@@ -95,15 +139,11 @@ class CartesianPlane(tk.Canvas):
 
     def cartesian_plan_coordinates(self, x, y):
         """Converts canvas coordinates to Cartesian plane coordinates."""
-        if not self.origin:
-            self.origin = (self.winfo_width() / 2, self.winfo_height() / 2)
-        return x - self.origin[0], self.origin[1] - y
+        return x - self._ox, self._oy - y
 
     def get_pixel_coordinates(self, x, y):
         """Converts Cartesian plane coordinates to canvas pixel coordinates."""
-        if not self.origin:
-            self.origin = (self.winfo_width() / 2, self.winfo_height() / 2)
-        return x + self.origin[0], self.origin[1] - y
+        return x + self._ox, self._oy - y
 
     def _on_mouse_move(self, event):
         """Event handler for mouse movement."""
@@ -123,73 +163,79 @@ class CartesianPlane(tk.Canvas):
             if not self.edges:
                 self.edges = (event.x, event.y)
             else:
-                rasterization.draw_DDA_line(self.edges[0], self.edges[1], event.x, event.y, self, color=(0, 0, 0))
-                self.lines.append(((self.edges[0], self.edges[1]), (event.x, event.y)))
+                rasterization.draw_DDA_line(self.edges[0], self.edges[1], event.x, event.y, self, color=(0, 0, 0),
+                                            tags=(self.line_tag(len(self.lines)), self.scene_tag))
+                self.lines.append(*self.edges, event.x, event.y)
                 self.edges = None
         elif self.drawing_line_bresenham:
             if not self.edges:
                 self.edges = (event.x, event.y)
             else:
-                rasterization.draw_Bresenham_line(self.edges[0], self.edges[1], event.x, event.y, self, (0, 0, 255))
-                self.lines.append(((self.edges[0], self.edges[1]), (event.x, event.y)))
+                rasterization.draw_Bresenham_line(self.edges[0], self.edges[1], event.x, event.y, self, (0, 0, 255),
+                                                  tags=(self.line_tag(len(self.lines)), self.scene_tag))
+                self.lines.append(*self.edges, event.x, event.y)
                 self.edges = None
         elif self.drawing_circle_bresenham:
             if not self.edges:
                 self.edges = (event.x, event.y)
             else:
-                rasterization.draw_Bresenham_circle(self.edges[0], self.edges[1],
-                                                    euclidean_distance(self.edges[0], self.edges[1], event.x, event.y),
-                                                    self, color=(0, 0, 0))
-                self.circles.append(((self.edges[0], self.edges[1]),
-                                     euclidean_distance(self.edges[0], self.edges[1], event.x, event.y)))
+                radius = euclidean_distance(self.edges[0], self.edges[1], event.x, event.y)
+                self.draw_pixel(*self.edges, (0, 0, 0), self.scene_tag)
+                rasterization.draw_Bresenham_circle(self.edges[0], self.edges[1], radius, self, color=(0, 0, 0),
+                                                    tags=self.scene_tag)
+                self.circles.append(*self.edges, radius)
                 self.edges = None
         elif self.drawing_cohen_clipping:
             if not self.edges:
                 self.edges = (event.x, event.y)
             else:
-                clipped_lines = []
-
-                print()
-                print(str(self.lines))
-                for line in self.lines:
-                    accepted, l = clipping.clipping_cohen_sutherland(line[0][0], line[0][1], line[1][0], line[1][1],
-                                                                     self.edges, (event.x, event.y), self)
-                    if accepted:
-                        clipped_lines.append(l)
-                print(str(clipped_lines))
-
-                self.delete("all")
-                self.draw_axes()
-
-                self.create_rectangle(*self.edges, (event.x, event.y), outline="red")
+                self._clip_lines(clipping.clip_cohen_sutherland_batch, event.x, event.y)
 
-                self.lines = clipped_lines
-                self.edges = None
                 self.drawing_cohen_clipping = False
-                for line in self.lines:
-                    rasterization.draw_DDA_line(line[0][0], line[0][1], line[1][0], line[1][1], self, (0, 0, 0))
         elif self.drawing_liang_clipping:
             if not self.edges:
                 self.edges = (event.x, event.y)
             else:
-                clipped_lines = []
+                self._clip_lines(clipping.clip_liang_barsky_batch, event.x, event.y)
+
+                self.drawing_liang_clipping = False
+        elif self.drawing_skala_clipping:
+            if not self.edges:
+                self.edges = (event.x, event.y)
+            else:
+                self._clip_lines(clipping.clip_skala_batch, event.x, event.y)
 
-                for line in self.lines:
-                    accepted, l = clipping.clipping_liang_barsky(line[0][0], line[0][1], line[1][0], line[1][1],
-                                                                 self.edges[0], self.edges[1], event.x, event.y, self)
-                    if accepted:
-                        clipped_lines.append(l)
+                self.drawing_skala_clipping = False
 
-                self.delete("all")
-                self.draw_axes()
+    def _clip_lines(self, clip_batch, x_final, y_final):
+        """Clips all lines against the window spanned by self.edges and (x_final, y_final) in one batch call."""
+        lines = self.lines.rows
 
-                self.create_rectangle(*self.edges, (event.x, event.y), outline="red")
+        # The window may be dragged from any corner; the clippers expect its minimum corner first
+        xmin, xmax = sorted((self.edges[0], x_final))
+        ymin, ymax = sorted((self.edges[1], y_final))
+        accept, x1, y1, x2, y2 = clip_batch(lines[:, 0], lines[:, 1], lines[:, 2], lines[:, 3], xmin, ymin, xmax, ymax)
+        clipped = np.column_stack((x1, y1, x2, y2))
+        changed = accept & np.any(clipped != lines, axis=1)
 
-                self.lines = clipped_lines
-                self.edges = None
-                self.drawing_liang_clipping = False
-                for line in self.lines:
-                    rasterization.draw_DDA_line(line[0][0], line[0][1], line[1][0], line[1][1], self, (0, 0, 0))
+        # Only rejected and shortened lines leave the canvas; lines fully inside keep their pixels
+        for i in np.flatnonzero(~accept | changed).tolist():
+            self.delete(self.line_tag(i))
+
+        # Dropping rejected rows shifts indices down; retagging in ascending order never collides
+        for new_i, old_i in enumerate(np.flatnonzero(accept).tolist()):
+            if new_i != old_i and not changed[old_i]:
+                self.addtag_withtag(self.line_tag(new_i), self.line_tag(old_i))
+                self.dtag(self.line_tag(old_i))
+
+        self.lines.rows = clipped[accept]
+        self.draw_lines(np.flatnonzero(changed[accept]))
+
+        # Click marks and the previous window go, as when the canvas was cleared; the scene and axes stay
+        self.delete_overlays()
+        self.create_rectangle(*self.edges, (x_final, y_final), outline="red", tags="clip_window")
+
+        self.edges = None
 
     def translate_points(self, delta_x, delta_y):
         """Translates all points by specified deltas."""""
@@ -197,84 +243,108 @@ class CartesianPlane(tk.Canvas):
 
     def rotate_lines(self, angle):
         """Rotates all lines by the specified angle."""
-        rotated_lines = []
-        for line in self.lines:
-            rotated_line = transformation2d.rotate(line, angle, self)
-            rotated_lines.append(rotated_line)
-        self.lines = rotated_lines
+        # Each line rotates around its own starting point
+        lines = self.lines.points
+        lines[:] = transformation2d.rotate_batch(lines, angle, lines[:, 0])
 
-        self.delete("all")
-        self.draw_axes()
-        for line in self.lines:
-            rasterization.draw_DDA_line(line[0][0], line[0][1], line[1][0], line[1][1], self, (0, 0, 0))
-        for circle in self.circles:
-            self.draw_pixel(circle[0][0], circle[0][1], (0, 0, 0))
-            rasterization.draw_Bresenham_circle(circle[0][0], circle[0][1], circle[1], self, (0, 0, 0))
+        self.redraw_scene()
 
     def scale(self, factor):
         """Scales all lines and circles by the specified factor."""
-        scaled_lines = []
-        scaled_circles = []
+        # Lines scale around their starting point and circles around their center
+        lines = self.lines.points
+        lines[:] = transformation2d.apply_affine(lines, transformation2d.scaling_matrix(factor, factor, lines[:, 0]))
+        self.circles.r[:] *= abs(factor)
 
-        for line in self.lines:
-            scaled_line = transformation2d.scale_line(line, factor, self)
-            scaled_lines.append(scaled_line)
-        for circle in self.circles:
-            scaled_circle = transformation2d.scale_circle(circle, factor, self)
-            scaled_circles.append(scaled_circle)
-
-        self.delete("all")
-        self.draw_axes()
-
-        self.lines = scaled_lines
-        self.circles = scaled_circles
-
-        for line in self.lines:
-            rasterization.draw_DDA_line(line[0][0], line[0][1], line[1][0], line[1][1], self, (0, 0, 0))
-        for circle in self.circles:
-            self.draw_pixel(circle[0][0], circle[0][1], (0, 0, 0))
-            rasterization.draw_Bresenham_circle(circle[0][0], circle[0][1], circle[1], self, (0, 0, 0))
+        self.redraw_scene()
 
     def reflect(self, axis):
         """Reflects all lines and circles across the specified axis."""
-        reflected_lines = []
-        reflected_circles = []
-
-        # Reflect lines
-        for line in self.lines:
-            reflected_line = transformation2d.reflect_line(line, axis, self)
-            reflected_lines.append(reflected_line)
+        # Reflect line endpoints and circle centers around the origin of the plane
+        lines = self.lines.points
+        lines[:] = transformation2d.reflect_lines_batch(lines, axis, self)
+        centers = self.circles.centers
+        centers[:] = transformation2d.apply_affine(centers, transformation2d.reflection_matrix(axis, self))
 
-        # Reflect circles
-        for circle in self.circles:
-            reflected_circle = transformation2d.reflect_circle(circle, axis, self)
-            reflected_circles.append(reflected_circle)
+        self.redraw_scene()
 
-        # Clear canvas
+    def redraw_scene(self):
+        """Clears the canvas and draws the axes and all stored lines and circles again."""
         self.delete("all")
         self.draw_axes()
 
-        self.lines = reflected_lines
-        self.circles = reflected_circles
-
-        # Draw reflected lines
-        for line in self.lines:
-            rasterization.draw_DDA_line(line[0][0], line[0][1], line[1][0], line[1][1], self, (0, 0, 0))
-
-        # Draw reflected circles
-        for circle in self.circles:
-            self.draw_pixel(circle[0][0], circle[0][1], (0, 0, 0))
-            rasterization.draw_Bresenham_circle(circle[0][0], circle[0][1], circle[1], self, (0, 0, 0))
-
-    def draw_pixel(self, x, y, color):
+        with self.batch():
+            self.draw_lines()
+            for xc, yc, r in self.circles.rows.tolist():
+                self.draw_pixel(xc, yc, (0, 0, 0), self.scene_tag)
+                rasterization.draw_Bresenham_circle(xc, yc, r, self, (0, 0, 0), self.scene_tag)
+
+    @staticmethod
+    def line_tag(i):
+        """Returns the canvas tag shared by every pixel of the i-th stored line."""
+        return f"line{i}"
+
+    def draw_lines(self, indices=None, color=(0, 0, 0)):
+        """Rasterizes the stored lines at indices (all by default), tagging each line's pixels with its own tag."""
+        if indices is None:
+            indices = np.arange(len(self.lines))
+        lines = self.lines.rows[indices]
+
+        # Lines on whole pixels (e.g. after a rotation) take the integer-only Bresenham batch; DDA is kept for the
+        # fractional endpoints clipping and scaling leave behind
+        whole = np.all(lines == np.rint(lines), axis=1)
+        with self.batch():
+            self._draw_dda_lines(indices[~whole], lines[~whole], color)
+            whole_lines = lines[whole].astype(np.int64)
+            rasterization.draw_lines_batch(whole_lines[:, 0], whole_lines[:, 1], whole_lines[:, 2], whole_lines[:, 3],
+                                           self, color, [(self.line_tag(i), self.scene_tag) for i in indices[whole]])
+
+    def _draw_dda_lines(self, indices, lines, color):
+        """Rasterizes lines with the batched DDA, tagging the pixels of each with the tag of its index."""
+        pixels, counts = rasterization.rasterize_dda_batch(lines[:, 0], lines[:, 1], lines[:, 2], lines[:, 3])
+
+        points = pixels.tolist()
+        ends = np.cumsum(counts).tolist()
+        for i, start, end in zip(indices.tolist(), [0] + ends, ends):
+            self.draw_pixels(points[start:end], color, (self.line_tag(i), self.scene_tag))
+
+    def draw_pixel(self, x, y, color, tags=None):
         """Draws a pixel on the canvas at the specified coordinates with the given color."""
-        color_hex = '#{0:02x}{1:02x}{2:02x}'.format(color[0], color[1], color[2])
-        self.create_rectangle(x, y, x + 1, y + 1, fill=color_hex)
+        self.draw_pixels(((x, y),), color, tags)
+
+    def draw_pixels(self, points, color, tags=None):
+        """Draws all (x, y) points (a sequence or an (N, 2) array) with the given color as a single Tcl script."""
+        if isinstance(points, np.ndarray):
+            points = points.tolist()
+        options = f"-fill {color_hex(color)}"
+        if tags:
+            options += " -tags {%s}" % (tags if isinstance(tags, str) else " ".join(tags))
+        commands = [f"{self._w} create rectangle {x} {y} {x + 1} {y + 1} {options}" for x, y in points]
+
+        if self._pending is not None:
+            self._pending.extend(commands)
+        elif commands:
+            self.tk.eval("\n".join(commands))
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Defers every draw_pixels call made inside the block and flushes them to Tcl in one eval on exit."""
+        if self._pending is not None:  # already inside a batch
+            yield
+            return
+
+        self._pending = []
+        try:
+            yield
+        finally:
+            commands, self._pending = self._pending, None
+            if commands:
+                self.tk.eval("\n".join(commands))
 
     def on_click_list(self):
         """Prints the list of lines to the console."""
-        for line in self.lines:
-            print(f"Line from: {line[0]} to {line[1]}")
+        for x1, y1, x2, y2 in self.lines.rows.tolist():
+            print(f"Line from: {(x1, y1)} to {(x2, y2)}")
 
     def toggle_cohen_clipping(self):
         """Activates Cohen-Sutherland clipping mode."""
@@ -308,6 +378,7 @@ class App(tk.Tk):
         self.reflect_button = None
         self.cohen_button = None
         self.liang_button = None
+        self.skala_button = None
         self.clear_button = None
 
         # Create organized buttons
@@ -362,7 +433,10 @@ class App(tk.Tk):
         self.cohen_button.pack(side=tk.LEFT, padx=(0, 5))
 
         self.liang_button = tk.Button(clip_frame, text="Liang Clipping", command=self.toggle_liang_clipping)
-        self.liang_button.pack(side=tk.LEFT)
+        self.liang_button.pack(side=tk.LEFT, padx=(0, 5))
+
+        self.skala_button = tk.Button(clip_frame, text="Skala Clipping", command=self.toggle_skala_clipping)
+        self.skala_button.pack(side=tk.LEFT)
 
     def create_other_buttons(self):
         other_frame = tk.Frame(self.menu_frame, bg="lightgrey")
@@ -401,6 +475,18 @@ class App(tk.Tk):
             self.cartesian_plane.drawing_line_bresenham = False
             self.cartesian_plane.drawing_cohen_clipping = False
 
+    def toggle_skala_clipping(self):
+        if self.cartesian_plane.drawing_skala_clipping:
+            self.skala_button.config(relief=tk.RAISED)
+            self.cartesian_plane.drawing_skala_clipping = False
+        else:
+            self.skala_button.config(relief=tk.SUNKEN)
+            self.cartesian_plane.drawing_skala_clipping = True
+            self.cartesian_plane.drawing_line_dda = False
+            self.cartesian_plane.drawing_line_bresenham = False
+            self.cartesian_plane.drawing_cohen_clipping = False
+            self.cartesian_plane.drawing_liang_clipping = False
+
     def toggle_bresenham(self):
         if self.cartesian_plane.drawing_line_bresenham:
             self.bresenham_button.config(relief=tk.RAISED)
@@ -422,8 +508,8 @@ class App(tk.Tk):
 
     def clear_screen(self):
         self.cartesian_plane.delete("all")
-        self.cartesian_plane.lines = []
-        self.cartesian_plane.circles = []
+        self.cartesian_plane.lines.clear()
+        self.cartesian_plane.circles.clear()
         self.cartesian_plane.draw_axes()
 
     def translate_popup(self):
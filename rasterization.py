@@ -1,4 +1,15 @@
-def draw_DDA_line(x1, y1, x2, y2, cartesian_plane, color):
+import functools
+
+import numpy as np
+
+from _rasterization_numba import (_dda_line_kernel, _dda_batch_kernel, _bresenham_line_kernel,
+                                  _bresenham_batch_kernel, _bresenham_circle_octant_kernel)
+
+# Signs that mirror an octant of (x, y) points, and of the swapped (y, x) points, onto the rest of the circle
+_OCTANT_SIGNS = np.array([[-1, 1], [1, -1], [1, 1], [-1, -1]], dtype=np.float64)
+
+
+def draw_DDA_line(x1, y1, x2, y2, cartesian_plane, color, tags=None):
     """
         Draw a line using the Digital Differential Analyzer (DDA) algorithm.
 
@@ -9,31 +20,40 @@ def draw_DDA_line(x1, y1, x2, y2, cartesian_plane, color):
             y2 (int): y-coordinate of the ending point.
             cartesian_plane (Canvas): The canvas where the line will be drawn.
             color (tuple): RGB color tuple representing the line color.
+            tags (str or tuple): Canvas tags attached to every pixel of the line.
 
         Returns:
             None
         """
-    dx = x2 - x1
-    dy = y2 - y1
+    pixels = _dda_line_kernel(x1, y1, x2, y2)
+    cartesian_plane.draw_pixels(pixels, color, tags)
+
+
+def rasterize_dda_batch(x1, y1, x2, y2):
+    """
+        Rasterize many lines at once with the Digital Differential Analyzer (DDA) algorithm.
+
+        Args:
+            x1, y1: Arrays (shape (N,)) with the coordinates of the starting points of the lines.
+            x2, y2: Arrays (shape (N,)) with the coordinates of the ending points of the lines.
 
-    if abs(dx) > abs(dy):
-        steps = abs(dx)
-    else:
-        steps = abs(dy)
+        Returns:
+            Tuple: (pixels, counts), where pixels (shape (M, 2)) holds the pixels of all lines one after the other and
+            counts (shape (N,)) holds the number of pixels of each line.
+        """
+    x1, y1, x2, y2 = (np.ascontiguousarray(a, dtype=np.float64) for a in (x1, y1, x2, y2))
 
-    x_incr = dx / steps
-    y_incr = dy / steps
-    x = x1
-    y = y1
+    # np.round and the kernel's round both round half to even, so every line gets exactly the rows it fills
+    counts = np.round(np.maximum(np.abs(x2 - x1), np.abs(y2 - y1))).astype(np.int64) + 1
+    starts = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=starts[1:])
 
-    cartesian_plane.draw_pixel(round(x), round(y), color)
-    for k in range(round(steps)):
-        x += x_incr
-        y += y_incr
-        cartesian_plane.draw_pixel(round(x), round(y), color)
+    pixels = np.empty((starts[-1], 2), dtype=np.int64)
+    _dda_batch_kernel(x1, y1, x2, y2, starts, pixels)
+    return pixels, counts
 
 
-def draw_Bresenham_line(x_initial, y_initial, x_final, y_final, cartesian_plane, color):
+def draw_Bresenham_line(x_initial, y_initial, x_final, y_final, cartesian_plane, color, tags=None):
     """
         Draw a line using the Bresenham's line drawing algorithm.
 
@@ -44,84 +64,85 @@ def draw_Bresenham_line(x_initial, y_initial, x_final, y_final, cartesian_plane,
             y_final (int): y-coordinate of the ending point.
             cartesian_plane (Canvas): The canvas where the line will be drawn.
             color (tuple): RGB color tuple representing the line color.
+            tags (str or tuple): Canvas tags attached to every pixel of the line.
 
         Returns:
             None
         """
-    dx = abs(x_final - x_initial)  # Delta x
-    dy = abs(y_final - y_initial)  # Delta y
-
-    if x_initial < x_final:
-        incrx = 1
-    else:
-        incrx = -1
-
-    if y_initial < y_final:
-        incry = 1
-    else:
-        incry = -1
-
-    x = x_initial
-    y = y_initial
-
-    cartesian_plane.draw_pixel(x, y, color)
-
-    if dx > dy:
-        decision_p = 2 * dy - dx
-        incE = 2 * dy
-        incNE = 2 * (dy - dx)
-
-        for _ in range(dx):
-            if decision_p <= 0:
-                decision_p += incE
-                x += incrx
-            else:
-                decision_p += incNE
-                x += incrx
-                y += incry
-            cartesian_plane.draw_pixel(x, y, color)
-    else:
-        decision_p = 2 * dx - dy
-        incN = 2 * dx
-        incNE = 2 * (dx - dy)
-
-        for _ in range(dy):
-            if decision_p <= 0:
-                decision_p += incN
-                y += incry
-            else:
-                decision_p += incNE
-                x += incrx
-                y += incry
-            cartesian_plane.draw_pixel(x, y, color)
-
-
-def plot_circumference_points(xc, x, yc, y, cartesian_plane, color):
+    pixels = _bresenham_line_kernel(x_initial, y_initial, x_final, y_final)
+    cartesian_plane.draw_pixels(pixels, color, tags)
+
+
+def rasterize_bresenham_batch(x1, y1, x2, y2):
     """
-        Plot points around the circumference of a circle.
+        Rasterize many lines at once with Bresenham's line drawing algorithm.
 
         Args:
-            xc (int): x-coordinate of the circle's center.
-            x (int): x-coordinate of the point to plot relative to the center.
-            yc (int): y-coordinate of the circle's center.
-            y (int): y-coordinate of the point to plot relative to the center.
-            cartesian_plane (Canvas): The canvas where the points will be drawn.
-            color (tuple): RGB color tuple representing the point color.
+            x1, y1: Arrays (shape (N,)) with the integer coordinates of the starting points of the lines.
+            x2, y2: Arrays (shape (N,)) with the integer coordinates of the ending points of the lines.
+
+        Returns:
+            Tuple: (pixels, counts), where pixels (shape (M, 2)) holds the pixels of all lines one after the other and
+            counts (shape (N,)) holds the number of pixels of each line.
+        """
+    x1, y1, x2, y2 = (np.ascontiguousarray(a, dtype=np.int64) for a in (x1, y1, x2, y2))
+
+    counts = np.maximum(np.abs(x2 - x1), np.abs(y2 - y1)) + 1
+    starts = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=starts[1:])
+
+    pixels = np.empty((starts[-1], 2), dtype=np.int64)
+    _bresenham_batch_kernel(x1, y1, x2, y2, starts, pixels)
+    return pixels, counts
+
+
+def draw_lines_batch(x1, y1, x2, y2, cartesian_plane, color, tags=None):
+    """
+        Draw many lines using Bresenham's line drawing algorithm, rasterized in one parallel batch.
+
+        Args:
+            x1, y1: Arrays (shape (N,)) with the integer coordinates of the starting points of the lines.
+            x2, y2: Arrays (shape (N,)) with the integer coordinates of the ending points of the lines.
+            cartesian_plane (Canvas): The canvas where the lines will be drawn.
+            color (tuple): RGB color tuple representing the lines color.
+            tags (sequence): Canvas tags of each line, attached to every pixel of that line.
 
         Returns:
             None
         """
-    cartesian_plane.draw_pixel(xc - x, yc + y, color)
-    cartesian_plane.draw_pixel(xc + x, yc - y, color)
-    cartesian_plane.draw_pixel(xc + x, yc + y, color)
-    cartesian_plane.draw_pixel(xc - x, yc - y, color)
-    cartesian_plane.draw_pixel(xc + y, yc + x, color)
-    cartesian_plane.draw_pixel(xc - y, yc + x, color)
-    cartesian_plane.draw_pixel(xc + y, yc - x, color)
-    cartesian_plane.draw_pixel(xc - y, yc - x, color)
+    pixels, counts = rasterize_bresenham_batch(x1, y1, x2, y2)
+
+    points = pixels.tolist()
+    ends = np.cumsum(counts).tolist()
+    if tags is None:
+        tags = [None] * len(ends)
+    with cartesian_plane.batch():
+        for line_tags, start, end in zip(tags, [0] + ends, ends):
+            cartesian_plane.draw_pixels(points[start:end], color, line_tags)
+
+
+@functools.lru_cache(maxsize=4096)
+def _circle_points(r):
+    """
+        Compute the pixels of a circle centered at the origin, cached per radius.
+
+        Redraws of the scene rasterize the same radii over and over, and only the center changes between them. The
+        returned array is shared by every caller, so it is read-only.
+
+        Args:
+            r (float): Radius of the circle.
+
+        Returns:
+            np.ndarray: Read-only array of shape (N, 2) with one (x, y) pixel per row.
+        """
+    octant = _bresenham_circle_octant_kernel(r)
+    pixels = np.concatenate((octant * _OCTANT_SIGNS[:, None], octant[:, ::-1] * _OCTANT_SIGNS[:, None]))
+    pixels = pixels.reshape(-1, 2)
+    pixels.flags.writeable = False
+    return pixels
 
 
-def draw_Bresenham_circle(xc, yc, r, cartesian_plane, color):
+def draw_Bresenham_circle(xc, yc, r, cartesian_plane, color, tags=None):
     """
         Draw a circle using Bresenham's circle drawing algorithm.
 
@@ -131,19 +152,9 @@ def draw_Bresenham_circle(xc, yc, r, cartesian_plane, color):
             r (int): Radius of the circle.
             cartesian_plane (Canvas): The canvas where the circle will be drawn.
             color (tuple): RGB color tuple representing the circle color.
+            tags (str or tuple): Canvas tags attached to every pixel of the circle.
 
         Returns:
             None
         """
-    x = 0
-    y = r
-    p = 3 - 2 * r
-    plot_circumference_points(xc, x, yc, y, cartesian_plane, color)
-    while x < y:
-        if p < 0:
-            p = p + 4 * x + 6
-        else:
-            p = p + 4 * (x - y) + 10
-            y -= 1
-        x += 1
-        plot_circumference_points(xc, x, yc, y, cartesian_plane, color)
+    cartesian_plane.draw_pixels(_circle_points(float(r)) + (xc, yc), color, tags)
@@ -0,0 +1,111 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+def _store_rows(buffer, rows):
+    """Copies rows to the start of buffer, returning a buffer with at least twice the capacity if they don't fit."""
+    if len(rows) > len(buffer):
+        buffer = np.empty((max(2 * len(rows), 16), buffer.shape[1]), dtype=buffer.dtype)
+    buffer[:len(rows)] = rows
+    return buffer
+
+
+def _append_row(buffer, length, row):
+    """Stores row at index length of buffer, doubling the capacity first when it is full; returns the buffer."""
+    if length == len(buffer):
+        grown = np.empty((2 * len(buffer), buffer.shape[1]), dtype=buffer.dtype)
+        grown[:length] = buffer
+        buffer = grown
+    buffer[length] = row
+    return buffer
+
+
+@dataclass
+class LineBuffer:
+    """
+    The lines of a scene, one (x1, y1, x2, y2) row each, in a float32 buffer that doubles its capacity when full.
+
+    Keeping whole lines in rows lets points view them as an (N, 2, 2) array of endpoints for the affine pipeline and
+    the clippers without copying.
+
+    Attributes:
+        buffer (np.ndarray): Array of shape (capacity, 4) whose first length rows are the lines.
+        length (int): Number of stored lines.
+    """
+    buffer: np.ndarray = field(default_factory=lambda: np.empty((16, 4), dtype=np.float32))
+    length: int = 0
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def rows(self):
+        """View of shape (N, 4) with one line (x1, y1, x2, y2) per row."""
+        return self.buffer[:self.length]
+
+    @rows.setter
+    def rows(self, rows):
+        self.buffer = _store_rows(self.buffer, rows)
+        self.length = len(rows)
+
+    @property
+    def points(self):
+        """View of shape (N, 2, 2) with the starting and ending points of every line."""
+        return self.rows.reshape(-1, 2, 2)
+
+    def append(self, x1, y1, x2, y2):
+        """Appends a line, in amortized constant time."""
+        self.buffer = _append_row(self.buffer, self.length, (x1, y1, x2, y2))
+        self.length += 1
+
+    def clear(self):
+        """Removes every stored row, keeping the buffer for reuse."""
+        self.length = 0
+
+
+@dataclass
+class CircleBuffer:
+    """
+    The circles of a scene, one (xc, yc, r) row each, in a float32 buffer that doubles its capacity when full.
+
+    centers views the first two columns of the rows and r the last one.
+
+    Attributes:
+        buffer (np.ndarray): Array of shape (capacity, 3) whose first length rows are the circles.
+        length (int): Number of stored circles.
+    """
+    buffer: np.ndarray = field(default_factory=lambda: np.empty((16, 3), dtype=np.float32))
+    length: int = 0
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def rows(self):
+        """View of shape (N, 3) with one circle (xc, yc, r) per row."""
+        return self.buffer[:self.length]
+
+    @rows.setter
+    def rows(self, rows):
+        self.buffer = _store_rows(self.buffer, rows)
+        self.length = len(rows)
+
+    @property
+    def centers(self):
+        """View of shape (N, 2) with the center of every circle."""
+        return self.rows[:, :2]
+
+    @property
+    def r(self):
+        """View of shape (N,) with the radius of every circle."""
+        return self.rows[:, 2]
+
+    def append(self, xc, yc, r):
+        """Appends a circle, in amortized constant time."""
+        self.buffer = _append_row(self.buffer, self.length, (xc, yc, r))
+        self.length += 1
+
+    def clear(self):
+        """Removes every stored row, keeping the buffer for reuse."""
+        self.length = 0
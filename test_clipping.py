@@ -0,0 +1,95 @@
+import unittest
+
+import numpy as np
+
+import clipping
+
+
+class SkalaMatchesLiangBarskyTest(unittest.TestCase):
+    """clip_skala_batch's edge lookup table must give the same segments as the Liang-Barsky batch."""
+
+    windows = [(100, 120, 300, 280), (0, 0, 399, 399), (150, 150, 151, 300), (190, 190, 200, 210)]
+
+    def assert_same_clip(self, lines, window):
+        lines = np.asarray(lines, dtype=np.float32)
+        skala = clipping.clip_skala_batch(*lines.T, *window)
+        liang = clipping.clip_liang_barsky_batch(*lines.T, *window)
+
+        np.testing.assert_array_equal(skala[0], liang[0])
+        accept = liang[0]
+        for skala_coords, liang_coords in zip(skala[1:], liang[1:]):
+            np.testing.assert_allclose(skala_coords[accept], liang_coords[accept], atol=1e-3)
+
+    def test_random_lines(self):
+        # Integer endpoints on a small grid make lines through window vertices and along edges common
+        rng = np.random.default_rng(0)
+        lines = rng.integers(0, 400, (5000, 4))
+        for window in self.windows:
+            with self.subTest(window=window):
+                self.assert_same_clip(lines, window)
+
+    def test_every_lookup_table_code(self):
+        # Lines in all directions through the window center, near each corner (cutting off a single vertex) and far
+        # away reach every code but 5 and 10, which would need a line crossing all four edges
+        window = (100, 120, 300, 280)
+        angles = np.linspace(0, 2 * np.pi, 64, endpoint=False)
+        centers = [(200, 200), (400, 200)] + [(x, y) for x in (90, 310) for y in (110, 290)]
+        lines = [(cx - 300 * np.cos(a), cy - 300 * np.sin(a), cx + 300 * np.cos(a), cy + 300 * np.sin(a))
+                 for cx, cy in centers for a in angles]
+
+        x1, y1, x2, y2 = np.asarray(lines).T
+        side = [((y2 - y1) * (vx - x1) - (x2 - x1) * (vy - y1) >= 0) << bit
+                for bit, (vx, vy) in enumerate(((100, 120), (300, 120), (300, 280), (100, 280)))]
+        self.assertEqual(set(np.bitwise_or.reduce(side).tolist()), set(range(16)) - {5, 10})
+
+        self.assert_same_clip(lines, window)
+
+    def test_touching_and_boundary_lines(self):
+        window = (100, 120, 300, 280)
+        lines = [
+            (100, 120, 100, 200),  # along the left edge
+            (300, 150, 100, 150),  # horizontal through the window
+            (50, 120, 350, 120),  # along the bottom edge, past both corners
+            (80, 100, 320, 300),  # through two opposite corners
+            (300, 280, 400, 380),  # touching the top right corner from outside
+            (250, 330, 350, 230),  # touching the top right corner diagonally
+            (200, 200, 200, 200),  # zero-length inside
+            (10, 10, 10, 10),  # zero-length outside
+            (50, 50, 90, 400),  # missing the window
+        ]
+        self.assert_same_clip(lines, window)
+
+
+class CohenSutherlandMatchesLiangBarskyTest(unittest.TestCase):
+    """clip_cohen_sutherland_batch must terminate and give the same segments as the Liang-Barsky batch."""
+
+    window = (100, 120, 300, 280)
+
+    def assert_same_clip(self, lines):
+        lines = np.asarray(lines, dtype=np.float32)
+        cohen = clipping.clip_cohen_sutherland_batch(*lines.T, *self.window)
+        liang = clipping.clip_liang_barsky_batch(*lines.T, *self.window)
+
+        np.testing.assert_array_equal(cohen[0], liang[0])
+        accept = liang[0]
+        for cohen_coords, liang_coords in zip(cohen[1:], liang[1:]):
+            np.testing.assert_allclose(cohen_coords[accept], liang_coords[accept], atol=1e-3)
+
+    def test_random_lines(self):
+        rng = np.random.default_rng(0)
+        self.assert_same_clip(rng.integers(0, 400, (5000, 4)))
+
+    def test_lines_ending_on_corners(self):
+        # Rounding the intersection with one edge can leave the endpoint just outside the other, which used to cycle
+        lines = [(31, 239, 100, 120), (10, 232, 100, 120)]
+        rng = np.random.default_rng(1)
+        x_min, y_min, x_max, y_max = self.window
+        for corner in ((x_min, y_min), (x_max, y_min), (x_max, y_max), (x_min, y_max)):
+            starts = rng.integers(0, 400, (500, 2))
+            lines += [(x, y, *corner) for x, y in starts.tolist()]
+            lines += [(*corner, x, y) for x, y in starts.tolist()]
+        self.assert_same_clip(lines)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,108 @@
-import rasterization
+import functools
 import math
 
+import numpy as np
+
+import scene
+
+# Reflections with respect to the axes of the cartesian plane, in homogeneous coordinates
+REFLECT = {
+    "X": np.diag([1.0, -1.0, 1.0]),
+    "Y": np.diag([-1.0, 1.0, 1.0]),
+    "XY": np.diag([-1.0, -1.0, 1.0]),
+}
+
+
+def translation_matrix(tx, ty):
+    """
+    Build the 3x3 homogeneous matrix translating points by (tx, ty).
+
+    Args:
+        tx (float or np.ndarray): Translation amount along the x-axis.
+        ty (float or np.ndarray): Translation amount along the y-axis.
+
+    Returns:
+        np.ndarray: Array of shape (3, 3), or (N, 3, 3) when tx and ty are arrays of shape (N,).
+    """
+    tx, ty = np.broadcast_arrays(np.asarray(tx, dtype=np.float64), np.asarray(ty, dtype=np.float64))
+    matrix = np.zeros(tx.shape + (3, 3))
+    matrix[..., 0, 0] = matrix[..., 1, 1] = matrix[..., 2, 2] = 1
+    matrix[..., 0, 2] = tx
+    matrix[..., 1, 2] = ty
+    return matrix
+
+
+@functools.lru_cache(maxsize=512)
+def _cos_sin(angle):
+    """
+    Return the cosine and sine of an angle in degrees, cached for angles the UI repeats.
+
+    Args:
+        angle (float): The angle in degrees. Fractional angles are cached by exact value, so quantize them first
+            when they come from continuous input.
+
+    Returns:
+        tuple: (cos, sin) of the angle.
+    """
+    angle_rad = math.radians(angle)
+    return math.cos(angle_rad), math.sin(angle_rad)
+
+
+def rotation_matrix(angle, pivot=(0, 0)):
+    """
+    Build the 3x3 homogeneous matrix rotating points by the given angle around a pivot point.
+
+    Args:
+        angle (float): The angle of rotation in degrees.
+        pivot (tuple or np.ndarray): The center of rotation, or an array of shape (N, 2) with one per line.
+
+    Returns:
+        np.ndarray: Array of shape (3, 3), or (N, 3, 3) when there is one pivot per line.
+    """
+    c, s = _cos_sin(angle)
+    rotation = np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])
+
+    pivot = np.asarray(pivot, dtype=np.float64)
+    return translation_matrix(pivot[..., 0], pivot[..., 1]) @ rotation @ translation_matrix(-pivot[..., 0],
+                                                                                            -pivot[..., 1])
+
+
+def scaling_matrix(sx, sy, pivot=(0, 0)):
+    """
+    Build the 3x3 homogeneous matrix scaling points by (sx, sy) around a pivot point.
+
+    Args:
+        sx (float): The scaling factor along the x-axis.
+        sy (float): The scaling factor along the y-axis.
+        pivot (tuple or np.ndarray): The fixed point of the scaling, or an array of shape (N, 2) with one per line.
+
+    Returns:
+        np.ndarray: Array of shape (3, 3), or (N, 3, 3) when there is one pivot per line.
+    """
+    scaling = np.diag([sx, sy, 1]).astype(np.float64)
+
+    pivot = np.asarray(pivot, dtype=np.float64)
+    return translation_matrix(pivot[..., 0], pivot[..., 1]) @ scaling @ translation_matrix(-pivot[..., 0],
+                                                                                           -pivot[..., 1])
+
+
+def apply_affine(points, matrix):
+    """
+    Apply a 3x3 homogeneous transformation to an array of points in one matmul.
+
+    Transformations compose by multiplying their matrices (e.g. translation @ rotation @ scaling), so a chain of
+    them still takes a single pass over the points.
+
+    Args:
+        points (np.ndarray): Array of shape (..., 2) with the points, e.g. (N, 2, 2) for N lines.
+        matrix (np.ndarray): Array of shape (3, 3), or (N, 3, 3) with one matrix per line.
+
+    Returns:
+        np.ndarray: Array with the shape and dtype of points holding the transformed points.
+    """
+    homogeneous = np.concatenate((points, np.ones(points.shape[:-1] + (1,))), axis=-1)
+    return (homogeneous @ np.swapaxes(matrix, -1, -2))[..., :2].astype(points.dtype)
+
 
 def translate(tx, ty, cartesian_plane, lines=None, circles=None):
     """
@@ -10,65 +112,57 @@ def translate(tx, ty, cartesian_plane, lines=None, circles=None):
         tx (int): Translation amount along the x-axis.
         ty (int): Translation amount along the y-axis.
         cartesian_plane (Canvas): The canvas where the lines and circles will be translated.
-        lines (list): List of lines to be translated.
-        circles (list): List of circles to be translated.
+        lines (scene.LineBuffer): The lines, translated in place.
+        circles (scene.CircleBuffer): The circles, translated in place.
 
     Returns:
         None
     """
     if lines is None:
-        lines = []
+        lines = scene.LineBuffer()
     if circles is None:
-        circles = []
+        circles = scene.CircleBuffer()
 
-    cartesian_plane.delete("all")
-    cartesian_plane.draw_axes()
+    matrix = translation_matrix(tx, ty)
+    lines.points[:] = apply_affine(lines.points, matrix)
+    circles.centers[:] = apply_affine(circles.centers, matrix)
 
-    for line in lines:
-        rasterization.draw_DDA_line(line[0][0] + tx, line[0][1] + ty, line[1][0] + tx, line[1][1] + ty, cartesian_plane,
-                                    color=(255, 0, 0))
-    for circle in circles:
-        cartesian_plane.draw_pixel(circle[0][0] + tx, circle[0][1] + ty, (255, 0, 0))
-        rasterization.draw_Bresenham_circle(circle[0][0] + tx, circle[0][1] + ty, circle[1], cartesian_plane,
-                                            color=(255, 0, 0))
+    # A translation shifts the rendered pixels rigidly, so the scene is moved on the canvas instead of rasterized
+    # again; everything else (click marks, clipping window) is cleared as before
+    cartesian_plane.delete_overlays()
+    cartesian_plane.move(cartesian_plane.scene_tag, tx, ty)
+    cartesian_plane.itemconfigure(cartesian_plane.scene_tag, fill="red")
 
 
-def rotate(line, angle, cartesian_plane):
+def rotate_batch(lines, angle, pivots):
     """
-        Rotate a line by a given angle around its starting point.
+        Rotate many lines by the same angle, each around its own pivot point.
 
         Args:
-            line (tuple): A tuple containing the coordinates of the starting and ending points of the line.
+            lines (np.ndarray): Array of shape (N, 2, 2) with the starting and ending points of the lines.
             angle (float): The angle of rotation in degrees.
-            cartesian_plane (Canvas): The canvas where the rotated line will be drawn.
+            pivots (np.ndarray): Array of shape (N, 2) with the center of rotation of each line.
 
         Returns:
-            tuple: A tuple containing the coordinates of the rotated line.
+            np.ndarray: Array of shape (N, 2, 2) with the rotated lines, rounded to whole pixels.
         """
-    x1, y1 = line[0]
-    x2, y2 = line[1]
+    return np.rint(apply_affine(lines, rotation_matrix(angle, pivots)))
 
-    # Calculate pivot point (center of rotation)
-    pivot_x, pivot_y = x1, y1
 
-    angle_rad = math.radians(angle)
-
-    c = math.cos(angle_rad)
-    s = math.sin(angle_rad)
-
-    # Translate line so that the pivot is at the origin
-    x2 -= pivot_x
-    y2 -= pivot_y
-
-    # Perform rotation
-    new_x2 = x2 * c - y2 * s
-    new_y2 = x2 * s + y2 * c
+def rotate(line, angle, cartesian_plane):
+    """
+        Rotate a line by a given angle around its starting point.
 
-    # Translate back to original position
-    new_x2 += pivot_x
-    new_y2 += pivot_y
+        Args:
+            line (np.ndarray or tuple): Array of shape (2, 2) with the starting and ending points of the line.
+            angle (float): The angle of rotation in degrees.
+            cartesian_plane (Canvas): The canvas where the rotated line will be drawn.
 
-    return (round(x1), round(y1)), (round(new_x2), round(new_y2))
+        Returns:
+            np.ndarray: Array of shape (2, 2) and dtype int32 with the rotated line.
+        """
+    lines = np.asarray(line, dtype=np.float64)[None]
+    return rotate_batch(lines, angle, lines[:, 0])[0].astype(np.int32)
 
 
 def scale_line(line, scale_factor, cartesian_plane):
@@ -76,28 +170,15 @@ def scale_line(line, scale_factor, cartesian_plane):
         Scale a line by a given factor around its starting point.
 
         Args:
-            line (tuple): A tuple containing the coordinates of the starting and ending points of the line.
+            line (np.ndarray or tuple): Array of shape (2, 2) with the starting and ending points of the line.
             scale_factor (float): The scaling factor.
             cartesian_plane (Canvas): The canvas where the scaled line will be drawn.
 
         Returns:
-            tuple: A tuple containing the coordinates of the scaled line.
+            np.ndarray: Array of shape (2, 2) with the scaled line.
         """
-    (x1, y1), (x2, y2) = line
-
-    # Calculate the distance between the pivot point (x1, y1) and the other point (x2, y2)
-    dx = x2 - x1
-    dy = y2 - y1
-
-    # Scale the distance
-    dx_scaled = dx * scale_factor
-    dy_scaled = dy * scale_factor
-
-    # Calculate the new coordinates for the second point (x2, y2)
-    x2_new = x1 + dx_scaled
-    y2_new = y1 + dy_scaled
-
-    return (x1, y1), (x2_new, y2_new)
+    line = np.asarray(line, dtype=np.float64)
+    return apply_affine(line, scaling_matrix(scale_factor, scale_factor, line[0]))
 
 
 def scale_circle(circle, scale_factor, cartesian_plane):
@@ -120,28 +201,48 @@ def scale_circle(circle, scale_factor, cartesian_plane):
     return (xc, yc), r_scaled
 
 
+def reflection_matrix(axis, cartesian_plane):
+    """
+        Build the 3x3 homogeneous matrix reflecting canvas pixels with respect to an axis of the cartesian plane.
+
+        Args:
+            axis (str): The axis ('X', 'Y', or 'XY') with respect to which the points will be reflected.
+            cartesian_plane (Canvas): The canvas holding the pixel/cartesian conversion matrices.
+
+        Returns:
+            np.ndarray: Array of shape (3, 3) mapping pixel coordinates to reflected pixel coordinates.
+        """
+    return cartesian_plane.M_cart_to_pix @ REFLECT[axis] @ cartesian_plane.M_pix_to_cart
+
+
+def reflect_lines_batch(lines, axis, cartesian_plane):
+    """
+        Reflect many lines with respect to a given axis in one matmul.
+
+        Args:
+            lines (np.ndarray): Array of shape (N, 2, 2) with the starting and ending points of the lines.
+            axis (str): The axis ('X', 'Y', or 'XY') with respect to which the lines will be reflected.
+            cartesian_plane (Canvas): The canvas whose origin the axes go through.
+
+        Returns:
+            np.ndarray: Array of shape (N, 2, 2) with the reflected lines.
+        """
+    return apply_affine(lines, reflection_matrix(axis, cartesian_plane))
+
+
 def reflect_line(line, axis, cartesian_plane):
     """
         Reflect a line with respect to a given axis.
 
         Args:
-            line (tuple): A tuple containing the coordinates of the starting and ending points of the line.
+            line (np.ndarray or tuple): Array of shape (2, 2) with the starting and ending points of the line.
             axis (str): The axis ('X', 'Y', or 'XY') with respect to which the line will be reflected.
             cartesian_plane (Canvas): The canvas where the reflected line will be drawn.
 
         Returns:
-            tuple: A tuple containing the coordinates of the reflected line.
+            np.ndarray: Array of shape (2, 2) with the reflected line.
         """
-    (x1, y1), (x2, y2) = line
-    x1, y1 = cartesian_plane.cartesian_plan_coordinates(x1, y1)
-    x2, y2 = cartesian_plane.cartesian_plan_coordinates(x2, y2)
-
-    if axis == 'X':
-        return (cartesian_plane.get_pixel_coordinates(x1, -y1)), (cartesian_plane.get_pixel_coordinates(x2, -y2))
-    elif axis == 'Y':
-        return (cartesian_plane.get_pixel_coordinates(-x1, y1)), (cartesian_plane.get_pixel_coordinates(-x2, y2))
-    elif axis == 'XY':
-        return (cartesian_plane.get_pixel_coordinates(-x1, -y1)), (cartesian_plane.get_pixel_coordinates(-x2, -y2))
+    return apply_affine(np.asarray(line, dtype=np.float64), reflection_matrix(axis, cartesian_plane))
 
 
 def reflect_circle(circle, axis, cartesian_plane):
@@ -156,14 +257,6 @@ def reflect_circle(circle, axis, cartesian_plane):
         Returns:
             tuple: A tuple containing the coordinates of the reflected circle.
         """
-    (xc, yc), r = circle
-    xc, yc = cartesian_plane.cartesian_plan_coordinates(xc, yc)
-
-    if axis == 'X':
-        return cartesian_plane.get_pixel_coordinates(xc, -yc), r
-    elif axis == 'Y':
-        return cartesian_plane.get_pixel_coordinates(-xc, yc), r
-    elif axis == 'XY':
-        return cartesian_plane.get_pixel_coordinates(-xc, -yc), r
-
-
+    center, r = circle
+    center = apply_affine(np.array(center, dtype=np.float64), reflection_matrix(axis, cartesian_plane))
+    return tuple(center.tolist()), r